@@ -7,33 +7,77 @@ weekly summaries with macOS notifications.
 
 Requirements:
     pip install selenium webdriver-manager
+    pip install keyring                    # optional, in-process Keychain access
+    pip install orjson                     # optional, faster history I/O
+    pip install lxml                       # optional, parses the dashboard in-process
+    pip install pyobjc-framework-Cocoa     # opt-in, in-process notifications (no delivery check)
+    pip install playwright                 # optional, see USE_PLAYWRIGHT
 
 Usage:
     python freedom_tracker.py              # Scrape + show summary
     python freedom_tracker.py --notify     # Scrape + show summary + send macOS notification
+    python freedom_tracker.py --headless   # Scrape without opening a Chrome window
+    python freedom_tracker.py --daemon     # Keep a Chrome instance running for later scrapes
+    python freedom_tracker.py --stop-daemon  # Stop that background Chrome
     python freedom_tracker.py --history    # Show all stored weekly summaries
     python freedom_tracker.py --config     # Set up your credentials
 """
 
 import argparse
+import fnmatch
+import hashlib
 import json
 import os
 import re
+import signal
+import socket
 import subprocess
 import sys
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+try:
+    import keyring
+    import keyring.errors
+except ImportError:
+    keyring = None
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
 CONFIG_DIR = Path.home() / ".freedom-tracker"
-DATA_FILE = CONFIG_DIR / "usage_history.json"
+DATA_FILE = CONFIG_DIR / "usage_history.jsonl"
+LEGACY_DATA_FILE = CONFIG_DIR / "usage_history.json"
+CHROME_PROFILE_DIR = CONFIG_DIR / "chrome-profile"
+DRIVER_PATH_FILE = CONFIG_DIR / ".driver_path"
+
+# Resident Chrome started by --daemon; scrapes attach to it while its pid is
+# alive and owns the port (9222 is Chrome's default and often taken)
+CHROME_BINARY = "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"
+DEBUG_PORT = 9347
+DEBUGGER_ADDRESS = f"127.0.0.1:{DEBUG_PORT}"
+DAEMON_PID_FILE = CONFIG_DIR / ".daemon_pid"
 
 KEYCHAIN_SERVICE = "freedom-tracker"
 
+# Experimental: drive Chrome through Playwright instead of Selenium
+USE_PLAYWRIGHT = os.environ.get("FREEDOM_TRACKER_PLAYWRIGHT") == "1"
+
+# Credentials resolved from Keychain, memoized for the life of the process
+_config_cache: dict | None = None
+
 
 def _keychain_set(account: str, value: str):
     """Store a value in macOS Keychain. Overwrites if it already exists."""
@@ -60,17 +104,47 @@ def _keychain_get(account: str) -> str | None:
     return None
 
 
+def _keychain_get_many(*accounts: str) -> list[str] | None:
+    """
+    Retrieve several values from macOS Keychain. Returns None if any of them
+    is not found. Uses `keyring` (Security framework, no subprocess) when
+    installed, otherwise — or if Keychain access is denied — one `security`
+    call per account.
+    """
+    values = None
+    if keyring is not None:
+        try:
+            values = [keyring.get_password(KEYCHAIN_SERVICE, account) for account in accounts]
+        except keyring.errors.KeyringError:
+            values = None
+    if values is None:
+        values = [_keychain_get(account) for account in accounts]
+    if any(v is None for v in values):
+        return None
+    return values
+
+
 def load_config():
-    """Load stored credentials from macOS Keychain."""
-    phone = _keychain_get("phone")
-    pin = _keychain_get("pin")
+    """Load stored credentials from macOS Keychain (cached after first hit)."""
+    global _config_cache
+    if _config_cache is not None:
+        return _config_cache
+    values = _keychain_get_many("phone", "pin")
+    if values is None:
+        return None
+    phone, pin = values
     if phone and pin:
-        return {"phone": phone, "pin": pin}
+        _config_cache = {"phone": phone, "pin": pin}
+        return _config_cache
     return None
 
 
 def save_config(phone: str, pin: str):
     """Save credentials securely in macOS Keychain."""
+    global _config_cache
+    _config_cache = None
+    # Always written by /usr/bin/security so the items trust the same tool the
+    # README's commands and the fallback read path use
     _keychain_set("phone", phone)
     _keychain_set("pin", pin)
     print("✅ Credentials saved securely in macOS Keychain.")
@@ -100,24 +174,96 @@ def setup_config():
 # Usage History Storage
 # ---------------------------------------------------------------------------
 
+def _dumps_line(record: dict) -> bytes:
+    """Serialize one record as a JSON Lines entry."""
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return json.dumps(record).encode() + b"\n"
+
+
+def _loads_line(line: bytes) -> dict:
+    """Parse one JSON document (a JSON Lines entry, or the legacy history file)."""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _migrate_legacy_history():
+    """Convert a pre-JSONL usage_history.json into the JSON Lines file, once."""
+    if DATA_FILE.exists() or not LEGACY_DATA_FILE.exists():
+        return
+    save_history(_loads_line(LEGACY_DATA_FILE.read_bytes()))
+
+
 def load_history() -> list:
-    """Load usage history from disk."""
+    """Load usage history from disk (one JSON record per line)."""
+    _migrate_legacy_history()
     if not DATA_FILE.exists():
         return []
-    with open(DATA_FILE, "r") as f:
-        return json.load(f)
+    return [_loads_line(line) for line in DATA_FILE.read_bytes().splitlines() if line.strip()]
+
+
+def append_history(records: list):
+    """Append records to the history file without rewriting existing entries."""
+    if not records:
+        return
+    _migrate_legacy_history()
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    with open(DATA_FILE, "ab") as f:
+        f.write(b"".join(_dumps_line(r) for r in records))
 
 
 def save_history(history: list):
-    """Save usage history to disk."""
+    """Rewrite (compact) the whole history file from `history`."""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    with open(DATA_FILE, "w") as f:
-        json.dump(history, f, indent=2)
+    DATA_FILE.write_bytes(b"".join(_dumps_line(r) for r in history))
 
 
-def add_usage_record(usage_gb: float, plan_gb: float, cycle_start: str, cycle_end: str):
-    """Add a new usage record to history."""
-    history = load_history()
+def _record_digest(record: dict) -> bytes:
+    """Hash a record's contents, ignoring when it was scraped."""
+    content = {k: v for k, v in record.items() if k != "scraped_at"}
+    if orjson is not None:
+        payload = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+    else:
+        payload = json.dumps(content, sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+class HistoryWriter:
+    """
+    Context manager that loads history once, collects new records, and
+    appends them to the file in a single write on exit. Records whose
+    contents match an existing entry are skipped.
+
+        with HistoryWriter() as writer:
+            add_usage_record(..., writer=writer)
+    """
+
+    def __enter__(self):
+        self.history = load_history()
+        self._seen = {_record_digest(r) for r in self.history}
+        self._pending = []
+        return self
+
+    def add(self, record: dict) -> bool:
+        """Queue a record for writing. Returns False if it is a duplicate."""
+        digest = _record_digest(record)
+        if digest in self._seen:
+            return False
+        self._seen.add(digest)
+        self.history.append(record)
+        self._pending.append(record)
+        return True
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            append_history(self._pending)
+        return False
+
+
+def add_usage_record(usage_gb: float, plan_gb: float, cycle_start: str, cycle_end: str,
+                     writer: HistoryWriter | None = None):
+    """Add a new usage record to history (via `writer` if one is open)."""
     record = {
         "scraped_at": datetime.now().isoformat(),
         "week_ending": datetime.now().strftime("%Y-%m-%d"),
@@ -128,24 +274,336 @@ def add_usage_record(usage_gb: float, plan_gb: float, cycle_start: str, cycle_en
         "cycle_start": cycle_start,
         "cycle_end": cycle_end,
     }
-    history.append(record)
-    save_history(history)
+    if writer is None:
+        with HistoryWriter() as single:
+            single.add(record)
+    else:
+        writer.add(record)
     return record
 
 
 # ---------------------------------------------------------------------------
-# Web Scraper (Selenium)
+# Web Scraper (Selenium, or Playwright with USE_PLAYWRIGHT)
 # ---------------------------------------------------------------------------
 
-def scrape_freedom_mobile(phone: str, pin: str) -> dict:
+# "X.XX GB used of Y GB" or "X.XX / Y GB"
+_USAGE_PAIR_RE = re.compile(r'([\d.]+)\s*GB\s*(?:used\s*)?(?:of|/)\s*([\d.]+)\s*GB', re.IGNORECASE)
+_USAGE_SINGLE_RE = re.compile(r'([\d.]+)\s*GB', re.IGNORECASE)
+# "Jan 5 - Feb 4" or "2024-01-05 to 2024-02-04"
+_CYCLE_RE = re.compile(
+    r'(\w{3}\s+\d{1,2}|\d{4}-\d{2}-\d{2})\s*[-\u2013to]+\s*(\w{3}\s+\d{1,2}|\d{4}-\d{2}-\d{2})'
+)
+
+LOGIN_URL = "https://myaccount.freedommobile.ca/login"
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+# Subresources the scraper never needs — skipped to save network + render time
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.woff", "*.woff2",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*",
+]
+# Evaluate an XPath in the page and return every match's innerText in one call
+_XPATH_TEXTS_JS = (
+    "const r = document.evaluate(arguments[0], document, null,"
+    " XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);"
+    "const out = [];"
+    "for (let i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i).innerText);"
+    "return out;"
+)
+_LOGIN_INPUT_IDS = ["msisdnInput", "pinInput", "usernameInput", "passwordInput"]
+
+
+def _extra_input_selector(types: list) -> str:
+    """CSS selector for inputs of one of `types` that aren't the login fields."""
+    not_login = "".join(f":not(#{iid})" for iid in _LOGIN_INPUT_IDS)
+    selectors = [f"input[type='{t}']{not_login}" for t in types]
+    if "text" in types:
+        selectors.append(f"input:not([type]){not_login}")
+    return ", ".join(selectors)
+
+
+def _extract_usage(element_texts) -> dict:
+    """
+    Pull usage and billing-cycle figures out of the dashboard.
+
+    `element_texts(xpath)` must yield the non-empty text of each element
+    matching `xpath`. Returns a dict with keys usage_gb (None if not found),
+    plan_gb, cycle_start, cycle_end.
+    """
+    usage_gb = None
+    plan_gb = None
+    cycle_start = ""
+    cycle_end = ""
+
+    # Strategy 1: Look for "X.XX GB used of Y GB" or "X.XX / Y GB", stopping at
+    # the first pair; a lone "X GB" is only used if no pair turns up
+    single_gb = None
+    for text in element_texts(
+        "//*[not(self::script or self::style)]"
+        "[contains(text(), 'GB') or contains(text(), 'Data') or contains(text(), 'usage')]"
+    ):
+        match = _USAGE_PAIR_RE.search(text)
+        if match:
+            usage_gb = float(match.group(1))
+            plan_gb = float(match.group(2))
+            break
+
+        if single_gb is None:
+            match = _USAGE_SINGLE_RE.search(text)
+            if match:
+                single_gb = float(match.group(1))
+
+    if usage_gb is None:
+        usage_gb = single_gb
+
+    # Strategy 2: By class / data attribute names
+    if usage_gb is None:
+        for xpath in [
+            "//*[contains(@class, 'usage')]", "//*[contains(@class, 'data-used')]",
+            "//*[contains(@class, 'progress')]", "//*[@data-usage]", "//*[@data-used]",
+            "//*[contains(@class, 'consumption')]",
+        ]:
+            for text in element_texts(xpath):
+                match = _USAGE_SINGLE_RE.search(text)
+                if match:
+                    usage_gb = float(match.group(1))
+                    break
+            if usage_gb is not None:
+                break
+
+    # Strategy 3: Billing cycle dates — one case-folded pass over each text node
+    for text in element_texts(
+        "//*[contains(translate(text(), 'BCEGILNY', 'bcegilny'), 'cycle') or "
+        "contains(translate(text(), 'BCEGILNY', 'bcegilny'), 'billing')]"
+    ):
+        date_match = _CYCLE_RE.search(text)
+        if date_match:
+            cycle_start = date_match.group(1)
+            cycle_end = date_match.group(2)
+            break
+
+    return {
+        "usage_gb": usage_gb,
+        "plan_gb": plan_gb if plan_gb is not None else 0.0,
+        "cycle_start": cycle_start,
+        "cycle_end": cycle_end,
+    }
+
+
+_NON_TEXT_TAGS = {"script", "style", "template", "noscript"}
+
+
+def _rendered_text(element) -> str:
+    """
+    Approximate Selenium's `.text` for an lxml element: one line per text
+    node, skipping script/style/template/noscript and inline-hidden subtrees.
+    """
+    parts = []
+
+    def walk(el):
+        if not isinstance(el.tag, str) or el.tag.lower() in _NON_TEXT_TAGS:
+            return
+        if el.get("hidden") is not None:
+            return
+        if "display:none" in (el.get("style") or "").replace(" ", "").lower():
+            return
+        parts.append(el.text)
+        for child in el:
+            walk(child)
+            parts.append(child.tail)
+
+    walk(element)
+    return "\n".join(t.strip() for t in parts if t and t.strip())
+
+
+def _element_texts_for(page_source: str, live_texts):
+    """
+    Build the `element_texts(xpath)` callable for _extract_usage(). The page is
+    parsed once in-process with lxml and every strategy queries that same tree.
+    Without lxml, or if the captured source has no visible body text (an SPA
+    shell that hasn't rendered yet), each query goes to the live DOM through
+    `live_texts(xpath)` (one browser round-trip per query).
+    """
+    tree = None
+    if lxml is not None and page_source:
+        tree = lxml.html.fromstring(page_source)
+        body = tree.find(".//body")
+        if not _rendered_text(body if body is not None else tree):
+            tree = None
+
+    def element_texts(xpath):
+        """Lazily yield the text of each element matching `xpath`, skipping empty ones."""
+        if tree is not None:
+            texts = (_rendered_text(e) for e in tree.xpath(xpath))
+        else:
+            texts = live_texts(xpath)
+        for text in texts:
+            text = (text or "").strip()
+            if text:
+                yield text
+
+    return element_texts
+
+
+def _report_missing_usage(save_screenshot, page_source: str):
+    """Save a screenshot and the page HTML when no usage figure was found."""
+    debug_path = CONFIG_DIR / "debug_screenshot.png"
+    save_screenshot(str(debug_path))
+    debug_html = CONFIG_DIR / "debug_page.html"
+    with open(debug_html, "w") as f:
+        f.write(page_source)
+    print(f"⚠️  Could not find usage data on the page.")
+    print(f"   Debug screenshot: {debug_path}")
+    print(f"   Debug HTML: {debug_html}")
+
+
+def _chromedriver_path(install) -> tuple[str, bool]:
+    """
+    Return (path, from_cache) for the ChromeDriver binary: the path cached
+    from a previous run if it still exists, otherwise the one `install()`
+    (webdriver-manager) resolves, which is then cached.
+    """
+    if DRIVER_PATH_FILE.exists():
+        cached = DRIVER_PATH_FILE.read_text().strip()
+        if cached and Path(cached).exists():
+            return cached, True
+    driver_path = install()
+    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    DRIVER_PATH_FILE.write_text(driver_path)
+    return driver_path, False
+
+
+def _port_listening() -> bool:
+    """True if something is accepting connections on DEBUG_PORT."""
+    try:
+        with socket.create_connection(("127.0.0.1", DEBUG_PORT), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def _port_owned_by(pid: int) -> bool:
+    """True if pid is the process listening on DEBUG_PORT."""
+    try:
+        result = subprocess.run(
+            ["lsof", "-nP", f"-iTCP:{DEBUG_PORT}", "-sTCP:LISTEN", "-t"],
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return _port_listening()
+    return str(pid) in result.stdout.split()
+
+
+def _daemon_pid() -> int | None:
+    """Pid of the Chrome started with --daemon, if it is alive and listening."""
+    try:
+        pid = int(DAEMON_PID_FILE.read_text().strip())
+    except (FileNotFoundError, ValueError):
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return None
+    except PermissionError:
+        pass
+    return pid if _port_owned_by(pid) else None
+
+
+def _daemon_running() -> bool:
+    """True if a Chrome started with --daemon is accepting DevTools connections."""
+    return _daemon_pid() is not None
+
+
+def start_daemon(headless: bool = False):
+    """Launch a long-lived Chrome with remote debugging on the tracker profile."""
+    if _daemon_running():
+        print(f"✅ Chrome is already listening on {DEBUGGER_ADDRESS}")
+        return
+    DAEMON_PID_FILE.unlink(missing_ok=True)
+    if _port_listening():
+        print(f"❌ Port {DEBUG_PORT} is already in use by another process")
+        sys.exit(1)
+    CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    args = [
+        CHROME_BINARY,
+        f"--remote-debugging-port={DEBUG_PORT}",
+        f"--user-data-dir={CHROME_PROFILE_DIR}",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--window-size=1920,1080",
+        "--disable-blink-features=AutomationControlled",
+        f"--user-agent={USER_AGENT}",
+    ]
+    if headless:
+        args.append("--headless=new")
+    try:
+        proc = subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except FileNotFoundError:
+        print(f"❌ Google Chrome not found at {CHROME_BINARY}")
+        sys.exit(1)
+
+    # Chrome takes a moment to open the DevTools port; only report success
+    # once it is actually accepting connections
+    deadline = time.monotonic() + 10
+    while proc.poll() is None and time.monotonic() < deadline:
+        if _port_listening():
+            break
+        time.sleep(0.25)
+    if proc.poll() is not None or not _port_listening():
+        if proc.poll() is None:
+            proc.terminate()
+        print(f"❌ Chrome did not start listening on {DEBUGGER_ADDRESS}")
+        print("   Is another Chrome already using the tracker profile?")
+        sys.exit(1)
+
+    DAEMON_PID_FILE.write_text(str(proc.pid))
+    print(f"✅ Chrome started in the background (pid {proc.pid}) on {DEBUGGER_ADDRESS}")
+    print("   Scrapes will attach to it until it is stopped with --stop-daemon.")
+
+
+def stop_daemon():
+    """Terminate the Chrome started by start_daemon()."""
+    pid = _daemon_pid()
+    if pid is None:
+        DAEMON_PID_FILE.unlink(missing_ok=True)
+        print("ℹ️  No background Chrome is running.")
+        return
+    try:
+        os.kill(pid, signal.SIGTERM)
+        print(f"✅ Stopped background Chrome (pid {pid})")
+    except ProcessLookupError:
+        print("ℹ️  Background Chrome had already exited.")
+    DAEMON_PID_FILE.unlink(missing_ok=True)
+
+
+def scrape_freedom_mobile(phone: str, pin: str, headless: bool = False) -> dict:
     """
     Log into Freedom Mobile's My Account portal using phone number + PIN,
     handle OTP verification, and scrape data usage.
 
-    This is always interactive — Freedom Mobile requires SMS OTP every login.
+    Chrome keeps a persistent profile in CHROME_PROFILE_DIR, so while the
+    portal session is still valid the login and SMS OTP steps are skipped.
+    Otherwise this is interactive — Freedom Mobile requires SMS OTP every login.
+    With headless=True no window is shown; the OTP is still read from the terminal.
+    If a --daemon Chrome is running, the scraper attaches to it instead of
+    launching a new browser.
+
+    Set USE_PLAYWRIGHT (FREEDOM_TRACKER_PLAYWRIGHT=1) to run the same flow
+    through Playwright instead of Selenium.
 
     Returns a dict with keys: usage_gb, plan_gb, cycle_start, cycle_end
     """
+    if USE_PLAYWRIGHT:
+        return _scrape_with_playwright(phone, pin, headless)
+
     try:
         from selenium import webdriver
         from selenium.webdriver.chrome.service import Service
@@ -155,30 +613,80 @@ def scrape_freedom_mobile(phone: str, pin: str) -> dict:
         from selenium.webdriver.support import expected_conditions as EC
         from selenium.webdriver.common.keys import Keys
         from selenium.webdriver.support.ui import Select
+        from selenium.common.exceptions import (
+            SessionNotCreatedException,
+            StaleElementReferenceException,
+            TimeoutException,
+        )
         from webdriver_manager.chrome import ChromeDriverManager
     except ImportError:
         print("❌ Missing dependencies. Install them with:")
         print("   pip install selenium webdriver-manager")
         sys.exit(1)
 
-    LOGIN_URL = "https://myaccount.freedommobile.ca/login"
+    def find_extra_input(d, types):
+        """Return the first visible non-login input of one of `types`, else False."""
+        for inp in d.find_elements(By.CSS_SELECTOR, _extra_input_selector(types)):
+            try:
+                if inp.is_displayed():
+                    return inp
+            except StaleElementReferenceException:
+                # Replaced by a re-render since find_elements; poll again
+                continue
+        return False
+
+    attached = _daemon_running()
 
-    # Chrome opens visibly so user can watch and enter OTP
+    # Chrome opens visibly by default so user can watch the OTP flow
     chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_argument(
-        "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
+    if attached:
+        # Launch flags are fixed by start_daemon(); only the address is needed
+        chrome_options.debugger_address = DEBUGGER_ADDRESS
+    elif headless:
+        chrome_options.add_argument("--headless=new")
+    # Return from driver.get() at DOMContentLoaded; explicit waits cover the rest
+    chrome_options.page_load_strategy = "eager"
+    if not attached:
+        CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        chrome_options.add_argument(f"--user-data-dir={CHROME_PROFILE_DIR}")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_argument(f"--user-agent={USER_AGENT}")
+
+    if attached:
+        print(f"🌐 Attaching to running Chrome at {DEBUGGER_ADDRESS}...")
+        if headless:
+            print("   ⚠️  --headless ignored: the background Chrome keeps the mode it started with")
+    else:
+        print("🌐 Launching browser...")
+
+    def install():
+        return ChromeDriverManager().install()
 
-    print("🌐 Launching browser...")
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
+    try:
+        driver_path, from_cache = _chromedriver_path(install)
+        try:
+            driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+        except SessionNotCreatedException:
+            if not from_cache:
+                raise
+            # Cached driver may no longer match the installed Chrome — fetch a fresh one
+            DRIVER_PATH_FILE.unlink(missing_ok=True)
+            driver_path, _ = _chromedriver_path(install)
+            driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
+    except Exception as e:
+        print(f"❌ Error during scraping: {e}")
+        return None
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except Exception:
+        pass
 
     try:
         # ===============================================================
@@ -186,59 +694,78 @@ def scrape_freedom_mobile(phone: str, pin: str) -> dict:
         # ===============================================================
         print("🔑 Logging into Freedom Mobile...")
         driver.get(LOGIN_URL)
-        time.sleep(5)
 
-        # Ensure we're on Phone+PIN mode (not Username mode)
-        try:
-            phone_link = driver.find_element(By.XPATH,
-                "//a[contains(text(), 'Phone Number')] | "
-                "//span[contains(text(), 'Phone Number')] | "
-                "//button[contains(text(), 'Phone Number')]"
-            )
-            if phone_link.is_displayed():
-                phone_link.click()
-                print("   ✓ Switched to Phone Number login mode")
-                time.sleep(3)
-        except Exception:
-            pass
+        # Either the login form renders, or a still-valid session cookie in the
+        # profile redirects away from /login (to the dashboard or straight to OTP)
+        WebDriverWait(driver, 30).until(EC.any_of(
+            EC.not_(EC.url_contains("/login")),
+            EC.presence_of_element_located((By.ID, "msisdnInput")),
+            EC.presence_of_element_located((By.ID, "usernameInput")),
+        ))
+        current_url = driver.current_url
 
-        driver.save_screenshot(str(CONFIG_DIR / "debug_step1.png"))
+        if "/login" not in current_url.lower():
+            if "account-verification" in current_url.lower():
+                print("   ✓ Saved session found — skipping phone + PIN")
+            else:
+                print("   ✓ Existing session is still valid — skipping login")
+        else:
+            # Ensure we're on Phone+PIN mode (not Username mode)
+            try:
+                phone_link = driver.find_element(By.XPATH,
+                    "//a[contains(text(), 'Phone Number')] | "
+                    "//span[contains(text(), 'Phone Number')] | "
+                    "//button[contains(text(), 'Phone Number')]"
+                )
+                if phone_link.is_displayed():
+                    phone_link.click()
+                    print("   ✓ Switched to Phone Number login mode")
+            except Exception:
+                pass
+
+            driver.save_screenshot(str(CONFIG_DIR / "debug_step1.png"))
+
+            # ===============================================================
+            # STEP 2: Fill phone + PIN and submit
+            # ===============================================================
+            phone_input = WebDriverWait(driver, 10).until(
+                EC.element_to_be_clickable((By.ID, "msisdnInput"))
+            )
+            pin_input = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.ID, "pinInput"))
+            )
 
-        # ===============================================================
-        # STEP 2: Fill phone + PIN and submit
-        # ===============================================================
-        phone_input = driver.find_element(By.ID, "msisdnInput")
-        pin_input = driver.find_element(By.ID, "pinInput")
+            phone_input.click()
+            phone_input.clear()
+            phone_input.send_keys(phone)
+            print("   ✓ Phone number entered")
 
-        phone_input.click()
-        time.sleep(0.3)
-        phone_input.clear()
-        phone_input.send_keys(phone)
-        print("   ✓ Phone number entered")
+            pin_input.click()
+            pin_input.clear()
+            pin_input.send_keys(pin)
+            print("   ✓ PIN entered")
 
-        time.sleep(0.5)
+            driver.save_screenshot(str(CONFIG_DIR / "debug_step2_filled.png"))
 
-        pin_input.click()
-        time.sleep(0.3)
-        pin_input.clear()
-        pin_input.send_keys(pin)
-        print("   ✓ PIN entered")
+            pin_input.send_keys(Keys.RETURN)
+            print("   ✓ Sign In submitted")
 
-        time.sleep(1)
-        driver.save_screenshot(str(CONFIG_DIR / "debug_step2_filled.png"))
+            print("   ⏳ Waiting for verification page...")
+            try:
+                WebDriverWait(driver, 30).until(EC.any_of(
+                    EC.url_contains("account-verification"),
+                    EC.presence_of_element_located((By.ID, "maskedChannelList")),
+                    EC.not_(EC.url_contains("/login")),
+                ))
+            except TimeoutException:
+                pass
 
-        pin_input.send_keys(Keys.RETURN)
-        print("   ✓ Sign In submitted")
+            current_url = driver.current_url
+            print(f"   Current URL: {current_url[:80]}...")
 
         # ===============================================================
         # STEP 3: Handle OTP verification
         # ===============================================================
-        print("   ⏳ Waiting for verification page...")
-        time.sleep(10)
-
-        current_url = driver.current_url
-        print(f"   Current URL: {current_url[:80]}...")
-
         if "account-verification" in current_url.lower():
             print("   🔐 OTP verification required")
 
@@ -246,7 +773,9 @@ def scrape_freedom_mobile(phone: str, pin: str) -> dict:
             phone_suffix = phone[-2:]
             print(f"   Selecting phone ending in {phone_suffix}...")
 
-            delivery_select = driver.find_element(By.ID, "maskedChannelList")
+            delivery_select = WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.ID, "maskedChannelList"))
+            )
             select = Select(delivery_select)
 
             for option in select.options:
@@ -256,27 +785,21 @@ def scrape_freedom_mobile(phone: str, pin: str) -> dict:
                     print(f"   ✓ Selected: {option.text.strip()}")
                     break
 
-            time.sleep(3)
             driver.save_screenshot(str(CONFIG_DIR / "debug_verify_selected.png"))
 
             # 3b: Enter full phone number in the new field that appears
             print("   Entering phone number for verification...")
-            all_inputs = driver.find_elements(By.TAG_NAME, "input")
-            visible_inputs = [i for i in all_inputs if i.is_displayed()]
-            for inp in visible_inputs:
-                iid = inp.get_attribute("id") or ""
-                itype = inp.get_attribute("type") or ""
-                if iid in ["msisdnInput", "pinInput", "usernameInput", "passwordInput"]:
-                    continue
-                if itype in ["tel", "text", "number"]:
-                    inp.click()
-                    time.sleep(0.3)
-                    inp.clear()
-                    inp.send_keys(phone)
-                    print(f"   ✓ Phone number entered")
-                    break
+            try:
+                inp = WebDriverWait(
+                    driver, 10, ignored_exceptions=[StaleElementReferenceException]
+                ).until(lambda d: find_extra_input(d, ["tel", "text", "number"]))
+                inp.click()
+                inp.clear()
+                inp.send_keys(phone)
+                print(f"   ✓ Phone number entered")
+            except TimeoutException:
+                pass
 
-            time.sleep(1)
             driver.save_screenshot(str(CONFIG_DIR / "debug_verify_phone.png"))
 
             # 3c: Click Next to send the SMS
@@ -318,23 +841,12 @@ def scrape_freedom_mobile(phone: str, pin: str) -> dict:
                 raise Exception("No verification code entered.")
 
             # 3e: Find the code input and enter it
-            code_input = None
-            all_inputs = driver.find_elements(By.TAG_NAME, "input")
-            for inp in all_inputs:
-                if inp.is_displayed():
-                    iid = inp.get_attribute("id") or ""
-                    itype = inp.get_attribute("type") or ""
-                    if iid in ["msisdnInput", "pinInput", "usernameInput", "passwordInput"]:
-                        continue
-                    if itype in ["text", "tel", "number", "password"]:
-                        code_input = inp
-                        break
+            code_input = find_extra_input(driver, ["text", "tel", "number", "password"])
 
-            if code_input is None:
+            if not code_input:
                 raise Exception("Could not find verification code input field.")
 
             code_input.click()
-            time.sleep(0.3)
             code_input.clear()
             code_input.send_keys(code)
             print("   ✓ Code entered")
@@ -356,7 +868,12 @@ def scrape_freedom_mobile(phone: str, pin: str) -> dict:
                 print("   ✓ Submitted via Enter key")
 
             print("   ⏳ Waiting for dashboard to load...")
-            time.sleep(10)
+            try:
+                WebDriverWait(driver, 30).until(
+                    EC.not_(EC.url_contains("account-verification"))
+                )
+            except TimeoutException:
+                pass
 
             current_url = driver.current_url
             print(f"   Current URL: {current_url[:80]}...")
@@ -366,90 +883,22 @@ def scrape_freedom_mobile(phone: str, pin: str) -> dict:
         # ===============================================================
         # STEP 4: Scrape data usage from dashboard
         # ===============================================================
-        time.sleep(5)
         print("📊 Scraping data usage...")
-
-        page_source = driver.page_source
-
-        usage_gb = None
-        plan_gb = None
-        cycle_start = ""
-        cycle_end = ""
-
-        # Strategy 1: Look for "X.XX GB used of Y GB" or "X.XX / Y GB"
-        usage_elements = driver.find_elements(By.XPATH,
-            "//*[contains(text(), 'GB') or contains(text(), 'Data') or contains(text(), 'usage')]"
-        )
-        for elem in usage_elements:
-            text = elem.text.strip()
-            if not text:
-                continue
-
-            match = re.search(r'([\d.]+)\s*GB\s*(?:used\s*)?(?:of|/)\s*([\d.]+)\s*GB', text, re.IGNORECASE)
-            if match:
-                usage_gb = float(match.group(1))
-                plan_gb = float(match.group(2))
-                break
-
-            match = re.search(r'([\d.]+)\s*GB', text, re.IGNORECASE)
-            if match and usage_gb is None:
-                usage_gb = float(match.group(1))
-
-        # Strategy 2: By CSS class names
-        if usage_gb is None:
-            for selector in [
-                "[class*='usage']", "[class*='data-used']", "[class*='progress']",
-                "[data-usage]", "[data-used]", "[class*='consumption']"
-            ]:
-                try:
-                    elems = driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in elems:
-                        text = elem.text.strip()
-                        match = re.search(r'([\d.]+)\s*GB', text, re.IGNORECASE)
-                        if match:
-                            usage_gb = float(match.group(1))
-                            break
-                    if usage_gb is not None:
-                        break
-                except Exception:
-                    continue
-
-        # Strategy 3: Billing cycle dates
-        cycle_elements = driver.find_elements(By.XPATH,
-            "//*[contains(text(), 'cycle') or contains(text(), 'Cycle') or "
-            "contains(text(), 'billing') or contains(text(), 'Billing')]"
-        )
-        for elem in cycle_elements:
-            text = elem.text.strip()
-            date_match = re.search(
-                r'(\w{3}\s+\d{1,2}|\d{4}-\d{2}-\d{2})\s*[-\u2013to]+\s*(\w{3}\s+\d{1,2}|\d{4}-\d{2}-\d{2})',
-                text
+        try:
+            WebDriverWait(driver, 30).until(
+                EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "GB")
             )
-            if date_match:
-                cycle_start = date_match.group(1)
-                cycle_end = date_match.group(2)
-                break
+        except TimeoutException:
+            pass
 
-        if usage_gb is None:
-            debug_path = CONFIG_DIR / "debug_screenshot.png"
-            driver.save_screenshot(str(debug_path))
-            debug_html = CONFIG_DIR / "debug_page.html"
-            with open(debug_html, "w") as f:
-                f.write(page_source)
-            print(f"⚠️  Could not find usage data on the page.")
-            print(f"   Debug screenshot: {debug_path}")
-            print(f"   Debug HTML: {debug_html}")
+        page_source = driver.page_source
+        usage = _extract_usage(_element_texts_for(
+            page_source, lambda xpath: driver.execute_script(_XPATH_TEXTS_JS, xpath)
+        ))
+        if usage["usage_gb"] is None:
+            _report_missing_usage(driver.save_screenshot, page_source)
             return None
-
-        if plan_gb is None:
-            plan_gb = 0.0
-
-        return {
-            "usage_gb": usage_gb,
-            "plan_gb": plan_gb,
-            "cycle_start": cycle_start,
-            "cycle_end": cycle_end,
-        }
+        return usage
 
     except Exception as e:
         debug_path = CONFIG_DIR / "debug_screenshot.png"
@@ -462,21 +911,279 @@ def scrape_freedom_mobile(phone: str, pin: str) -> dict:
         return None
 
     finally:
+        # With debugger_address set, quit() only ends chromedriver; the daemon stays up
         driver.quit()
-        print("🌐 Browser closed.")
+        print("🌐 Detached from browser." if attached else "🌐 Browser closed.")
+
+
+def _scrape_with_playwright(phone: str, pin: str, headless: bool = False) -> dict:
+    """
+    Playwright port of scrape_freedom_mobile(). Talks to Chrome over a single
+    CDP connection instead of WebDriver HTTP calls; same steps and return value.
+    """
+    try:
+        from playwright.sync_api import sync_playwright
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+    except ImportError:
+        print("❌ Missing dependencies. Install them with:")
+        print("   pip install playwright")
+        sys.exit(1)
+
+    CHROME_PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # A --daemon Chrome holds the profile lock, so attach to it rather than launch
+    attached = _daemon_running()
+    if attached:
+        print(f"🌐 Attaching to running Chrome at {DEBUGGER_ADDRESS}...")
+        if headless:
+            print("   ⚠️  --headless ignored: the background Chrome keeps the mode it started with")
+    else:
+        print("🌐 Launching browser...")
+
+    with sync_playwright() as pw:
+        if attached:
+            browser = pw.chromium.connect_over_cdp(f"http://{DEBUGGER_ADDRESS}")
+            context = browser.contexts[0]
+            page = context.new_page()
+        else:
+            context = pw.chromium.launch_persistent_context(
+                str(CHROME_PROFILE_DIR),
+                channel="chrome",
+                headless=headless,
+                viewport={"width": 1920, "height": 1080},
+                user_agent=USER_AGENT,
+                args=["--disable-blink-features=AutomationControlled"],
+                ignore_default_args=["--enable-automation"],
+            )
+            page = context.pages[0] if context.pages else context.new_page()
+        # Routed per page so the daemon's other tabs are left alone
+        page.route(
+            lambda url: any(fnmatch.fnmatch(url, pattern) for pattern in BLOCKED_URLS),
+            lambda route: route.abort(),
+        )
+
+        try:
+            # ===============================================================
+            # STEP 1: Navigate to login page
+            # ===============================================================
+            print("🔑 Logging into Freedom Mobile...")
+            page.goto(LOGIN_URL, wait_until="domcontentloaded")
+
+            # Either the login form renders, or a still-valid session cookie in the
+            # profile redirects away from /login (to the dashboard or straight to OTP)
+            page.wait_for_function(
+                "!location.href.includes('/login')"
+                " || document.querySelector('#msisdnInput, #usernameInput') !== null",
+                timeout=30_000,
+            )
+
+            if "/login" not in page.url.lower():
+                if "account-verification" in page.url.lower():
+                    print("   ✓ Saved session found — skipping phone + PIN")
+                else:
+                    print("   ✓ Existing session is still valid — skipping login")
+            else:
+                # Ensure we're on Phone+PIN mode (not Username mode)
+                phone_link = page.locator("a, span, button").filter(has_text="Phone Number").first
+                if phone_link.is_visible():
+                    phone_link.click()
+                    print("   ✓ Switched to Phone Number login mode")
+
+                page.screenshot(path=str(CONFIG_DIR / "debug_step1.png"))
+
+                # ===============================================================
+                # STEP 2: Fill phone + PIN and submit
+                # ===============================================================
+                page.locator("#msisdnInput").fill(phone)
+                print("   ✓ Phone number entered")
+                page.locator("#pinInput").fill(pin)
+                print("   ✓ PIN entered")
+
+                page.screenshot(path=str(CONFIG_DIR / "debug_step2_filled.png"))
+
+                page.locator("#pinInput").press("Enter")
+                print("   ✓ Sign In submitted")
+
+                print("   ⏳ Waiting for verification page...")
+                try:
+                    page.wait_for_url(
+                        lambda url: "account-verification" in url or "/login" not in url,
+                        timeout=30_000,
+                    )
+                except PlaywrightTimeoutError:
+                    pass
+
+                print(f"   Current URL: {page.url[:80]}...")
+
+            # ===============================================================
+            # STEP 3: Handle OTP verification
+            # ===============================================================
+            if "account-verification" in page.url.lower():
+                print("   🔐 OTP verification required")
+
+                # 3a: Select phone delivery from dropdown
+                phone_suffix = phone[-2:]
+                print(f"   Selecting phone ending in {phone_suffix}...")
+
+                page.locator("#maskedChannelList").wait_for(state="attached", timeout=10_000)
+                options = page.locator("#maskedChannelList option").evaluate_all(
+                    "opts => opts.map(o => [o.value, o.textContent])"
+                )
+                for val, label in options:
+                    if val.endswith(phone_suffix) and "@" not in val:
+                        page.locator("#maskedChannelList").select_option(value=val)
+                        print(f"   ✓ Selected: {label.strip()}")
+                        break
+
+                page.screenshot(path=str(CONFIG_DIR / "debug_verify_selected.png"))
+
+                # 3b: Enter full phone number in the new field that appears
+                print("   Entering phone number for verification...")
+                phone_field = page.locator(
+                    _extra_input_selector(["tel", "text", "number"])
+                ).locator("visible=true").first
+                try:
+                    phone_field.fill(phone, timeout=10_000)
+                    print(f"   ✓ Phone number entered")
+                except PlaywrightTimeoutError:
+                    pass
+
+                page.screenshot(path=str(CONFIG_DIR / "debug_verify_phone.png"))
+
+                # 3c: Click Next to send the SMS
+                next_button = page.locator("button").filter(has_text="Next").locator("visible=true").first
+                try:
+                    next_button.click(timeout=5_000)
+                    print("   ✓ Clicked Next — SMS code is being sent to your phone...")
+                except PlaywrightTimeoutError:
+                    print("   ⚠️  Could not click Next button")
+
+                page.wait_for_timeout(5_000)
+                page.screenshot(path=str(CONFIG_DIR / "debug_verify_code_page.png"))
+
+                # 3d: Ask user for the OTP code
+                print()
+                print("   📱 Check your phone for the SMS verification code!")
+                code = input("   Enter the verification code: ").strip()
+
+                if not code:
+                    raise Exception("No verification code entered.")
+
+                # 3e: Find the code input and enter it
+                code_input = page.locator(
+                    _extra_input_selector(["text", "tel", "number", "password"])
+                ).locator("visible=true").first
+                if code_input.count() == 0:
+                    raise Exception("Could not find verification code input field.")
+
+                code_input.fill(code)
+                print("   ✓ Code entered")
+
+                # 3f: Submit the code
+                submitted = False
+                for btn_text in ["Verify", "Submit", "Confirm", "Next"]:
+                    btn = page.locator("button").filter(has_text=btn_text).locator("visible=true").first
+                    if btn.count():
+                        btn.click()
+                        submitted = True
+                        print(f"   ✓ Clicked {btn_text}")
+                        break
+                if not submitted:
+                    code_input.press("Enter")
+                    print("   ✓ Submitted via Enter key")
+
+                print("   ⏳ Waiting for dashboard to load...")
+                try:
+                    page.wait_for_url(
+                        lambda url: "account-verification" not in url, timeout=30_000
+                    )
+                except PlaywrightTimeoutError:
+                    pass
+
+                print(f"   Current URL: {page.url[:80]}...")
+
+            page.screenshot(path=str(CONFIG_DIR / "debug_step3_afterlogin.png"))
+
+            # ===============================================================
+            # STEP 4: Scrape data usage from dashboard
+            # ===============================================================
+            print("📊 Scraping data usage...")
+            try:
+                page.wait_for_function(
+                    "document.body && document.body.innerText.includes('GB')", timeout=30_000
+                )
+            except PlaywrightTimeoutError:
+                pass
+
+            page_source = page.content()
+            usage = _extract_usage(_element_texts_for(
+                page_source, lambda xpath: page.locator(f"xpath={xpath}").all_inner_texts()
+            ))
+            if usage["usage_gb"] is None:
+                _report_missing_usage(lambda path: page.screenshot(path=path), page_source)
+                return None
+            return usage
+
+        except Exception as e:
+            debug_path = CONFIG_DIR / "debug_screenshot.png"
+            try:
+                page.screenshot(path=str(debug_path))
+            except Exception:
+                pass
+            print(f"❌ Error during scraping: {e}")
+            print(f"   Debug screenshot: {debug_path}")
+            return None
+
+        finally:
+            if attached:
+                # Leaving sync_playwright() only disconnects; the daemon stays up
+                page.close()
+                print("🌐 Detached from browser.")
+            else:
+                context.close()
+                print("🌐 Browser closed.")
 
 
 # ---------------------------------------------------------------------------
 # macOS Notification
 # ---------------------------------------------------------------------------
 
+def _deliver_native_notification(title: str, message: str, sound: str) -> bool:
+    """Deliver a notification in-process via pyobjc. Returns False if unavailable."""
+    try:
+        from Foundation import (
+            NSUserNotification,
+            NSUserNotificationCenter,
+            NSUserNotificationDefaultSoundName,
+        )
+    except ImportError:
+        return False
+    center = NSUserNotificationCenter.defaultUserNotificationCenter()
+    if center is None:
+        # No notification center outside an app bundle on some macOS versions
+        return False
+    notification = NSUserNotification.alloc().init()
+    notification.setTitle_(title)
+    notification.setInformativeText_(message)
+    notification.setSoundName_(NSUserNotificationDefaultSoundName if sound == "default" else sound)
+    center.deliverNotification_(notification)
+    return True
+
+
 def send_macos_notification(title: str, message: str, sound: str = "default"):
-    """Send a macOS notification using osascript."""
-    title = title.replace('"', '\\"')
-    message = message.replace('"', '\\"')
-    script = f'display notification "{message}" with title "{title}" sound name "{sound}"'
+    """Send a macOS notification via pyobjc, falling back to osascript."""
+    if _deliver_native_notification(title, message, sound):
+        print(f"🔔 Notification sent!")
+        return
+    # Pass text as script arguments so quotes in it can't break the AppleScript
+    script = [
+        "-e", "on run argv",
+        "-e", "display notification (item 2 of argv) with title (item 1 of argv) "
+              "sound name (item 3 of argv)",
+        "-e", "end run",
+    ]
     try:
-        subprocess.run(["osascript", "-e", script], check=True, capture_output=True)
+        subprocess.run(["osascript", *script, title, message, sound], check=True, capture_output=True)
         print(f"🔔 Notification sent!")
     except FileNotFoundError:
         print("⚠️  osascript not found — are you running this on macOS?")
@@ -488,27 +1195,39 @@ def send_macos_notification(title: str, message: str, sound: str = "default"):
 # Display / Formatting
 # ---------------------------------------------------------------------------
 
+_SUMMARY_HEAD = (
+    "╔══════════════════════════════════════════╗\n"
+    "║   📱 Freedom Mobile Weekly Data Summary  ║\n"
+    "╠══════════════════════════════════════════╣\n"
+    "║  Week Ending:  {week_ending:<25} ║\n"
+    "║  Data Used:    {usage_gb:<6.2f} GB                   ║"
+)
+_SUMMARY_PLAN = (
+    "║  Plan Total:   {plan_gb:<6.2f} GB                   ║\n"
+    "║  Remaining:    {remaining_gb:<6.2f} GB                   ║\n"
+    "║  Used:         {percent_used:<5.1f}%                    ║\n"
+    "║  [{bar}] ║"
+)
+_SUMMARY_CYCLE = "║  Billing Cycle: {cycle:<24} ║"
+_SUMMARY_FOOT = "╚══════════════════════════════════════════╝"
+
+_BAR_WIDTH = 30
+_BAR_FILLED = "█" * _BAR_WIDTH
+_BAR_EMPTY = "░" * _BAR_WIDTH
+
+
 def format_summary(record: dict) -> str:
     """Format a usage record into a readable summary."""
-    lines = []
-    lines.append("╔══════════════════════════════════════════╗")
-    lines.append("║   📱 Freedom Mobile Weekly Data Summary  ║")
-    lines.append("╠══════════════════════════════════════════╣")
-    lines.append(f"║  Week Ending:  {record['week_ending']:<25} ║")
-    lines.append(f"║  Data Used:    {record['usage_gb']:<6.2f} GB{' ' * 19}║")
+    parts = [_SUMMARY_HEAD.format(**record)]
     if record['plan_gb'] > 0:
-        lines.append(f"║  Plan Total:   {record['plan_gb']:<6.2f} GB{' ' * 19}║")
-        lines.append(f"║  Remaining:    {record['remaining_gb']:<6.2f} GB{' ' * 19}║")
-        lines.append(f"║  Used:         {record['percent_used']:<5.1f}%{' ' * 20}║")
-        bar_width = 30
-        filled = int(bar_width * record['percent_used'] / 100)
-        bar = "█" * filled + "░" * (bar_width - filled)
-        lines.append(f"║  [{bar}] ║")
+        filled = min(max(int(_BAR_WIDTH * record['percent_used'] / 100), 0), _BAR_WIDTH)
+        bar = _BAR_FILLED[:filled] + _BAR_EMPTY[filled:]
+        parts.append(_SUMMARY_PLAN.format(**record, bar=bar))
     if record.get('cycle_start') and record.get('cycle_end'):
         cycle_str = f"{record['cycle_start']} → {record['cycle_end']}"
-        lines.append(f"║  Billing Cycle: {cycle_str:<24} ║")
-    lines.append("╚══════════════════════════════════════════╝")
-    return "\n".join(lines)
+        parts.append(_SUMMARY_CYCLE.format(cycle=cycle_str))
+    parts.append(_SUMMARY_FOOT)
+    return "\n".join(parts)
 
 
 def show_history():
@@ -548,12 +1267,18 @@ Examples:
   python freedom_tracker.py --config     # First-time setup
   python freedom_tracker.py              # Scrape and show summary
   python freedom_tracker.py --notify     # Scrape + macOS notification
+  python freedom_tracker.py --headless   # Scrape without a browser window
+  python freedom_tracker.py --daemon     # Start a resident Chrome for faster scrapes
+  python freedom_tracker.py --stop-daemon  # Stop the resident Chrome
   python freedom_tracker.py --history    # View past summaries
         """
     )
     parser.add_argument("--config", action="store_true", help="Set up credentials")
     parser.add_argument("--notify", action="store_true", help="Send macOS notification with summary")
     parser.add_argument("--history", action="store_true", help="Show usage history")
+    parser.add_argument("--headless", action="store_true", help="Run Chrome without a visible window")
+    parser.add_argument("--daemon", action="store_true", help="Start a background Chrome that scrapes attach to")
+    parser.add_argument("--stop-daemon", action="store_true", help="Stop the background Chrome started by --daemon")
     args = parser.parse_args()
 
     if args.config:
@@ -564,7 +1289,15 @@ Examples:
         show_history()
         return
 
-    # --- Scrape mode (always interactive — OTP required every time) ---
+    if args.daemon:
+        start_daemon(headless=args.headless)
+        return
+
+    if args.stop_daemon:
+        stop_daemon()
+        return
+
+    # --- Scrape mode (interactive unless a saved session skips the OTP) ---
     config = load_config()
     if config is None:
         print("❌ No configuration found. Run setup first:")
@@ -576,7 +1309,7 @@ Examples:
     print(f"   {datetime.now().strftime('%A, %B %d, %Y at %I:%M %p')}")
     print()
 
-    result = scrape_freedom_mobile(config["phone"], config["pin"])
+    result = scrape_freedom_mobile(config["phone"], config["pin"], headless=args.headless)
 
     if result is None:
         print("\n❌ Failed to scrape usage data. Check the debug files for details.")
@@ -49,9 +49,12 @@ fi
 PYTHON="$VENV_DIR/bin/python3"
 
 echo "📦 Installing Python dependencies..."
-"$VENV_DIR/bin/pip" install --quiet selenium webdriver-manager
+"$VENV_DIR/bin/pip" install --quiet selenium webdriver-manager keyring orjson lxml
 echo "   ✓ selenium installed"
 echo "   ✓ webdriver-manager installed"
+echo "   ✓ keyring installed"
+echo "   ✓ orjson installed"
+echo "   ✓ lxml installed"
 
 # ---- Step 3: Check Chrome ----
 echo ""